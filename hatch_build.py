@@ -0,0 +1,47 @@
+"""Hatch build hook — pre-render the ``craigslist-mcp --info`` payload.
+
+The --info output depends only on static tables, so wheels ship it as
+``craigslist_mcp/_info.json`` and the CLI just copies it to stdout.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class InfoBuildHook(BuildHookInterface):
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        # Editable installs read the live source tree; a pre-rendered copy
+        # there would go stale as soon as the tables are edited.
+        if version == "editable":
+            return
+
+        src = os.path.join(self.root, "src")
+        sys.path.insert(0, src)
+        try:
+            from craigslist_mcp.__main__ import _INFO_FILE, _render_info
+
+            text = _render_info()
+        finally:
+            sys.path.remove(src)
+            for name in [m for m in sys.modules if m == "craigslist_mcp" or m.startswith("craigslist_mcp.")]:
+                del sys.modules[name]
+
+        self._tmpdir = tempfile.mkdtemp(prefix="craigslist-mcp-build-")
+        out = os.path.join(self._tmpdir, _INFO_FILE)
+        with open(out, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        build_data["force_include"][out] = f"craigslist_mcp/{_INFO_FILE}"
+
+    def finalize(self, version: str, build_data: dict[str, Any], artifact_path: str) -> None:
+        tmpdir = getattr(self, "_tmpdir", None)
+        if tmpdir:
+            shutil.rmtree(tmpdir, ignore_errors=True)
@@ -2,44 +2,160 @@
 
 from __future__ import annotations
 
-import argparse
+import os
 import sys
+from collections.abc import Mapping
 
+from craigslist_mcp import __version__
 
-def main() -> None:
-    parser = argparse.ArgumentParser(
-        prog="craigslist-mcp",
-        description="MCP server that searches Craigslist listings by location, category, and keyword.",
-    )
-    parser.add_argument(
-        "--verbose", "-v",
-        action="store_true",
-        help="Enable verbose/debug logging.",
-    )
-    parser.add_argument(
-        "--info",
-        action="store_true",
-        help="Print server info (locations, categories), then exit.",
+# Flags main() accepts besides -h/--help and -V/--version.
+_FLAGS = frozenset({"-v", "--verbose", "--info"})
+
+# --help text, laid out as argparse would print it and encoded once here so
+# it can go straight to the stdout buffer. Keep _OPTIONS in sync with _FLAGS.
+_USAGE = "craigslist-mcp [-h] [--version] [--verbose] [--info]"
+_OPTIONS = (
+    ("-h, --help", "show this help message and exit"),
+    ("--version, -V", "show program's version number and exit"),
+    ("--verbose, -v", "Enable verbose/debug logging."),
+    ("--info", "Print server info (locations, categories), then exit."),
+)
+_OPTION_WIDTH = max(len(flags) for flags, _ in _OPTIONS)
+_STATIC_HELP = (
+    f"usage: {_USAGE}\n"
+    "\n"
+    "MCP server that searches Craigslist listings by location, category, and\n"
+    "keyword.\n"
+    "\n"
+    "options:\n"
+    + "".join(f"  {flags:<{_OPTION_WIDTH}}  {text}\n" for flags, text in _OPTIONS)
+).encode()
+
+_DESCRIPTION = "MCP server — search Craigslist listings by location, category, and keyword."
+_INFO_FILE = "_info.json"
+
+# Modules that must not be loaded until the server actually starts.
+_HEAVY_MODULES = frozenset({"bs4", "httpx", "mcp", "fastmcp"})
+
+
+_JSON_ESCAPES = {
+    '"': '\\"', "\\": "\\\\", "\n": "\\n", "\r": "\\r",
+    "\t": "\\t", "\b": "\\b", "\f": "\\f",
+}
+
+
+def _json_str(text: str) -> str:
+    """Encode *text* as a JSON string literal, escaping like ``json.dumps``."""
+    out = []
+    for ch in text:
+        if ch in _JSON_ESCAPES:
+            out.append(_JSON_ESCAPES[ch])
+        elif " " <= ch <= "~":
+            out.append(ch)
+        else:
+            code = ord(ch)
+            if code > 0xFFFF:
+                code -= 0x10000
+                out.append("\\u%04x\\u%04x" % (0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF)))
+            else:
+                out.append("\\u%04x" % code)
+    return '"' + "".join(out) + '"'
+
+
+def _json_object(mapping: Mapping[str, str], indent: str) -> str:
+    """Render a flat str -> str mapping the way ``json.dumps(indent=2)`` does."""
+    if not mapping:
+        return "{}"
+    inner = indent + "  "
+    body = ",\n".join(f"{inner}{_json_str(k)}: {_json_str(v)}" for k, v in mapping.items())
+    return "{\n" + body + "\n" + indent + "}"
+
+
+def _render_info() -> str:
+    """Render the fixed-shape --info payload as indented JSON text.
+
+    The payload never changes shape, so it is assembled by hand rather than
+    importing the json module for a one-shot dump.
+    """
+    from itertools import islice
+
+    from craigslist_mcp.constants import LOCATIONS, CATEGORIES
+
+    sample_locations = dict(islice(LOCATIONS.items(), 20))
+    return (
+        "{\n"
+        '  "name": "craigslist-mcp",\n'
+        f'  "version": {_json_str(__version__)},\n'
+        f'  "description": {_json_str(_DESCRIPTION)},\n'
+        f'  "total_locations": {len(LOCATIONS)},\n'
+        f'  "sample_locations": {_json_object(sample_locations, "  ")},\n'
+        f'  "categories": {_json_object(CATEGORIES, "  ")}\n'
+        "}\n"
     )
-    args = parser.parse_args()
-
-    if args.info:
-        from craigslist_mcp.scraper import LOCATIONS, CATEGORIES
-        import json
-
-        info = {
-            "name": "craigslist-mcp",
-            "version": "0.1.0",
-            "description": "MCP server — search Craigslist listings by location, category, and keyword.",
-            "total_locations": len(LOCATIONS),
-            "sample_locations": dict(list(LOCATIONS.items())[:20]),
-            "categories": CATEGORIES,
-        }
-        print(json.dumps(info, indent=2))
-        sys.exit(0)
 
+
+def _info_text() -> str:
+    """Return the --info payload, preferring the copy pre-rendered at build time.
+
+    Wheels ship ``_info.json`` (written by ``hatch_build.py``); source
+    checkouts and editable installs render it on the fly instead.
+    """
+    path = os.path.join(os.path.dirname(__file__), _INFO_FILE)
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return fh.read()
+    except FileNotFoundError:
+        return _render_info()
+
+
+def _check_lazy_imports() -> None:
+    """Fail loudly if a heavy dependency was imported before it was needed.
+
+    Enabled by setting ``CRAIGSLIST_MCP_IMPORTCHECK=1``; guards the lazy
+    imports in this module against being hoisted by later refactors.
+    """
+    if not os.environ.get("CRAIGSLIST_MCP_IMPORTCHECK"):
+        return
+    loaded = sorted(_HEAVY_MODULES.intersection(sys.modules))
+    if loaded:
+        raise SystemExit(f"craigslist-mcp: heavy modules imported too early: {', '.join(loaded)}")
+
+
+def main() -> None:
+    # The CLI has two boolean flags, so argv is scanned by hand rather than
+    # paying for argparse. Help and version are answered before anything else.
+    argv = sys.argv[1:]
+    if "-h" in argv or "--help" in argv:
+        sys.stdout.buffer.write(_STATIC_HELP)
+        sys.stdout.buffer.flush()
+        os._exit(0)
+    if "-V" in argv or "--version" in argv:
+        sys.stdout.write(f"craigslist-mcp {__version__}\n")
+        sys.stdout.flush()
+        os._exit(0)
+
+    unknown = [arg for arg in argv if arg not in _FLAGS]
+    if unknown:
+        sys.stderr.write(
+            f"usage: {_USAGE}\n"
+            f"craigslist-mcp: error: unrecognized arguments: {' '.join(unknown)}\n"
+        )
+        sys.exit(2)
+    _check_lazy_imports()
+
+    if "--info" in argv:
+        sys.stdout.write(_info_text())
+        # Nothing to clean up on this path; skip interpreter teardown.
+        sys.stdout.flush()
+        os._exit(0)
+
+    verbose = "-v" in argv or "--verbose" in argv
+
+    # HEAVY IMPORT — do not hoist. Pulls in fastmcp and the MCP SDK, so it
+    # must stay below the argv checks and the --info exit; argument errors
+    # and the fast paths above never pay for it.
     from craigslist_mcp.server import run
-    run(verbose=args.verbose)
+    run(verbose=verbose)
 
 
 if __name__ == "__main__":
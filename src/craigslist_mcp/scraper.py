@@ -6,13 +6,28 @@ Uses httpx + BeautifulSoup to query Craigslist's public HTML pages.
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import logging
+import random
 import re
-from typing import Any
-from urllib.parse import urljoin, urlencode, urlparse
-
-import httpx
-from bs4 import BeautifulSoup
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote_plus, urljoin, urlparse
+
+from craigslist_mcp.constants import CATEGORIES, LOCATIONS
+
+# httpx, bs4, selectolax and asyncio are imported where they are used, so callers that
+# only need the lookup tables or URL building don't pay for them.
+if TYPE_CHECKING:
+    import httpx
+    from bs4 import BeautifulSoup, SoupStrainer
 
 logger = logging.getLogger("craigslist_mcp")
 
@@ -23,6 +38,25 @@ logger = logging.getLogger("craigslist_mcp")
 DEFAULT_LOCATION = "newyork"
 MAX_RESULTS = 120
 REQUEST_TIMEOUT = 30
+FETCH_CONCURRENCY = 10
+# Batch detail fetches: per-host request rate and max random delay (seconds)
+# before each request, to stay clear of Craigslist's anti-scraping limits.
+DETAIL_REQUESTS_PER_SECOND = 3.0
+FETCH_JITTER = 0.25
+# Statuses Craigslist answers with once it starts throttling a client
+_THROTTLED_STATUSES = frozenset({403, 429})
+
+# Valid location subdomains and category codes
+_VALID_LOCATIONS: frozenset[str] = frozenset(LOCATIONS)
+_VALID_CATEGORIES: frozenset[str] = frozenset(CATEGORIES)
+
+# Lowercased location names for the case-insensitive lookups: (code, name)
+# in table order for matching, and (code, name, lowercased) sorted by name
+# for listing
+_LOCATIONS_LOWER: tuple[tuple[str, str], ...] = tuple((k, v.lower()) for k, v in LOCATIONS.items())
+_LOCATIONS_BY_NAME: tuple[tuple[str, str, str], ...] = tuple(
+    (k, v, v.lower()) for k, v in sorted(LOCATIONS.items(), key=lambda x: x[1])
+)
 
 # Common headers to look like a real browser
 HEADERS = {
@@ -35,539 +69,75 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
-# ---------------------------------------------------------------------------
-# Craigslist locations (subdomain -> display name)
-# This is a comprehensive list of US + major international locations.
-# ---------------------------------------------------------------------------
-
-LOCATIONS: dict[str, str] = {
-    # --- United States ---
-    "auburn": "Auburn, AL",
-    "bham": "Birmingham, AL",
-    "dothan": "Dothan, AL",
-    "shoals": "Florence / Muscle Shoals, AL",
-    "gadsden": "Gadsden-Anniston, AL",
-    "huntsville": "Huntsville / Decatur, AL",
-    "mobile": "Mobile, AL",
-    "montgomery": "Montgomery, AL",
-    "tuscaloosa": "Tuscaloosa, AL",
-    "anchorage": "Anchorage / Mat-Su, AK",
-    "fairbanks": "Fairbanks, AK",
-    "kenai": "Kenai Peninsula, AK",
-    "juneau": "Juneau, AK",
-    "flagstaff": "Flagstaff / Sedona, AZ",
-    "mohave": "Mohave County, AZ",
-    "phoenix": "Phoenix, AZ",
-    "prescott": "Prescott, AZ",
-    "showlow": "Show Low, AZ",
-    "sierravista": "Sierra Vista, AZ",
-    "tucson": "Tucson, AZ",
-    "yuma": "Yuma, AZ",
-    "fayar": "Fayetteville, AR",
-    "fortsmith": "Fort Smith, AR",
-    "jonesboro": "Jonesboro, AR",
-    "littlerock": "Little Rock, AR",
-    "texarkana": "Texarkana, AR",
-    "bakersfield": "Bakersfield, CA",
-    "chico": "Chico, CA",
-    "fresno": "Fresno / Madera, CA",
-    "goldcountry": "Gold Country, CA",
-    "hanford": "Hanford-Corcoran, CA",
-    "humboldt": "Humboldt County, CA",
-    "imperial": "Imperial County, CA",
-    "inlandempire": "Inland Empire, CA",
-    "losangeles": "Los Angeles, CA",
-    "mendocino": "Mendocino County, CA",
-    "merced": "Merced, CA",
-    "modesto": "Modesto, CA",
-    "monterey": "Monterey Bay, CA",
-    "orangecounty": "Orange County, CA",
-    "palmsprings": "Palm Springs, CA",
-    "redding": "Redding, CA",
-    "sacramento": "Sacramento, CA",
-    "sandiego": "San Diego, CA",
-    "sfbay": "San Francisco Bay Area, CA",
-    "slo": "San Luis Obispo, CA",
-    "santabarbara": "Santa Barbara, CA",
-    "santamaria": "Santa Maria, CA",
-    "siskiyou": "Siskiyou County, CA",
-    "stockton": "Stockton, CA",
-    "susanville": "Susanville, CA",
-    "ventura": "Ventura County, CA",
-    "visalia": "Visalia-Tulare, CA",
-    "yubasutter": "Yuba-Sutter, CA",
-    "boulder": "Boulder, CO",
-    "cosprings": "Colorado Springs, CO",
-    "denver": "Denver, CO",
-    "eastco": "Eastern CO",
-    "fortcollins": "Fort Collins / North CO",
-    "pueblo": "Pueblo, CO",
-    "rockies": "High Rockies, CO",
-    "westslope": "Western Slope, CO",
-    "newhaven": "New Haven, CT",
-    "hartford": "Hartford, CT",
-    "nwct": "Northwest CT",
-    "eastern-ct": "Eastern CT",
-    "delaware": "Delaware",
-    "washingtondc": "Washington, DC",
-    "daytona": "Daytona Beach, FL",
-    "keys": "Florida Keys, FL",
-    "fortlauderdale": "Fort Lauderdale, FL",
-    "fortmyers": "Fort Myers / SW Florida, FL",
-    "gainesville": "Gainesville, FL",
-    "cfl": "Heartland Florida, FL",
-    "jacksonville": "Jacksonville, FL",
-    "lakeland": "Lakeland, FL",
-    "lakecity": "Lake City, FL",
-    "ocala": "Ocala, FL",
-    "okaloosa": "Okaloosa / Walton, FL",
-    "orlando": "Orlando, FL",
-    "panama": "Panama City, FL",
-    "pensacola": "Pensacola, FL",
-    "sarasota": "Sarasota-Bradenton, FL",
-    "miami": "South Florida / Miami, FL",
-    "spacecoast": "Space Coast, FL",
-    "staugustine": "St Augustine, FL",
-    "tallahassee": "Tallahassee, FL",
-    "tampa": "Tampa Bay Area, FL",
-    "treasure": "Treasure Coast, FL",
-    "albanyga": "Albany, GA",
-    "athens": "Athens, GA",
-    "atlanta": "Atlanta, GA",
-    "augusta": "Augusta, GA",
-    "brunswick": "Brunswick, GA",
-    "columbus": "Columbus, GA",
-    "macon": "Macon / Warner Robins, GA",
-    "nwga": "Northwest GA",
-    "savannah": "Savannah / Hinesville, GA",
-    "statesboro": "Statesboro, GA",
-    "valdosta": "Valdosta, GA",
-    "honolulu": "Hawaii",
-    "boise": "Boise, ID",
-    "easternidaho": "East Idaho, ID",
-    "lewiston": "Lewiston / Clarkston, ID",
-    "twinfalls": "Twin Falls, ID",
-    "bn": "Bloomington-Normal, IL",
-    "chambana": "Champaign Urbana, IL",
-    "chicago": "Chicago, IL",
-    "decatur": "Decatur, IL",
-    "lasalle": "La Salle Co, IL",
-    "mattoon": "Mattoon-Charleston, IL",
-    "peoria": "Peoria, IL",
-    "rockford": "Rockford, IL",
-    "carbondale": "Southern Illinois, IL",
-    "springfieldil": "Springfield, IL",
-    "quincy": "Western IL",
-    "bloomington": "Bloomington, IN",
-    "evansville": "Evansville, IN",
-    "fortwayne": "Fort Wayne, IN",
-    "indianapolis": "Indianapolis, IN",
-    "kokomo": "Kokomo, IN",
-    "lafayette": "Lafayette / West Lafayette, IN",
-    "muncie": "Muncie / Anderson, IN",
-    "richmondin": "Richmond, IN",
-    "southbend": "South Bend / Michiana, IN",
-    "terrehaute": "Terre Haute, IN",
-    "ames": "Ames, IA",
-    "cedarrapids": "Cedar Rapids, IA",
-    "desmoines": "Des Moines, IA",
-    "dubuque": "Dubuque, IA",
-    "fortdodge": "Fort Dodge, IA",
-    "iowacity": "Iowa City, IA",
-    "masoncity": "Mason City, IA",
-    "quadcities": "Quad Cities, IA/IL",
-    "siouxcity": "Sioux City, IA",
-    "ottumwa": "Southeast IA",
-    "waterloo": "Waterloo / Cedar Falls, IA",
-    "lawrence": "Lawrence, KS",
-    "ksu": "Manhattan, KS",
-    "nwks": "Northwest KS",
-    "salina": "Salina, KS",
-    "seks": "Southeast KS",
-    "swks": "Southwest KS",
-    "topeka": "Topeka, KS",
-    "wichita": "Wichita, KS",
-    "bgky": "Bowling Green, KY",
-    "eastky": "Eastern Kentucky",
-    "lexington": "Lexington, KY",
-    "louisville": "Louisville, KY",
-    "owensboro": "Owensboro, KY",
-    "westky": "Western KY",
-    "batonrouge": "Baton Rouge, LA",
-    "cenla": "Central Louisiana, LA",
-    "houma": "Houma, LA",
-    "lafayette": "Lafayette, LA",
-    "lakecharles": "Lake Charles, LA",
-    "monroe": "Monroe, LA",
-    "neworleans": "New Orleans, LA",
-    "shreveport": "Shreveport, LA",
-    "maine": "Maine",
-    "annapolis": "Annapolis, MD",
-    "baltimore": "Baltimore, MD",
-    "easternshore": "Eastern Shore, MD",
-    "frederick": "Frederick, MD",
-    "smd": "Southern Maryland",
-    "westmd": "Western Maryland",
-    "boston": "Boston, MA",
-    "capecod": "Cape Cod / Islands, MA",
-    "southcoast": "South Coast, MA",
-    "westernmass": "Western Massachusetts",
-    "worcester": "Worcester / Central MA",
-    "annarbor": "Ann Arbor, MI",
-    "battlecreek": "Battle Creek, MI",
-    "centralmich": "Central Michigan",
-    "detroit": "Detroit Metro, MI",
-    "flint": "Flint, MI",
-    "grandrapids": "Grand Rapids, MI",
-    "holland": "Holland, MI",
-    "jxn": "Jackson, MI",
-    "kalamazoo": "Kalamazoo, MI",
-    "lansing": "Lansing, MI",
-    "monroemi": "Monroe, MI",
-    "muskegon": "Muskegon, MI",
-    "nmi": "Northern Michigan",
-    "porthuron": "Port Huron, MI",
-    "saginaw": "Saginaw-Midland-Bay City, MI",
-    "swmi": "Southwest Michigan",
-    "thumb": "The Thumb, MI",
-    "up": "Upper Peninsula, MI",
-    "bemidji": "Bemidji, MN",
-    "brainerd": "Brainerd, MN",
-    "duluth": "Duluth / Superior, MN",
-    "mankato": "Mankato, MN",
-    "minneapolis": "Minneapolis / St Paul, MN",
-    "rmn": "Rochester, MN",
-    "marshall": "Southwest MN",
-    "stcloud": "St Cloud, MN",
-    "gulfport": "Gulfport / Biloxi, MS",
-    "hattiesburg": "Hattiesburg, MS",
-    "jackson": "Jackson, MS",
-    "meridian": "Meridian, MS",
-    "northmiss": "North Mississippi",
-    "natchez": "Southwest MS",
-    "columbiamo": "Columbia / Jeff City, MO",
-    "joplin": "Joplin, MO",
-    "kansascity": "Kansas City, MO",
-    "kirksville": "Kirksville, MO",
-    "loz": "Lake of the Ozarks, MO",
-    "semo": "Southeast Missouri",
-    "springfield": "Springfield, MO",
-    "stjoseph": "St Joseph, MO",
-    "stlouis": "St Louis, MO",
-    "billings": "Billings, MT",
-    "bozeman": "Bozeman, MT",
-    "butte": "Butte, MT",
-    "greatfalls": "Great Falls, MT",
-    "helena": "Helena, MT",
-    "kalispell": "Kalispell, MT",
-    "missoula": "Missoula, MT",
-    "montana": "Eastern Montana",
-    "grandisland": "Grand Island, NE",
-    "lincoln": "Lincoln, NE",
-    "northplatte": "North Platte, NE",
-    "omaha": "Omaha / Council Bluffs, NE",
-    "scottsbluff": "Scottsbluff / Panhandle, NE",
-    "elko": "Elko, NV",
-    "lasvegas": "Las Vegas, NV",
-    "reno": "Reno / Tahoe, NV",
-    "nh": "New Hampshire",
-    "cnj": "Central NJ",
-    "jerseyshore": "Jersey Shore, NJ",
-    "newjersey": "North Jersey, NJ",
-    "southjersey": "South Jersey, NJ",
-    "albuquerque": "Albuquerque, NM",
-    "clovis": "Clovis / Portales, NM",
-    "farmington": "Farmington, NM",
-    "lascruces": "Las Cruces, NM",
-    "roswell": "Roswell / Carlsbad, NM",
-    "santafe": "Santa Fe / Taos, NM",
-    "albany": "Albany, NY",
-    "binghamton": "Binghamton, NY",
-    "buffalo": "Buffalo, NY",
-    "catskills": "Catskills, NY",
-    "chautauqua": "Chautauqua, NY",
-    "elmira": "Elmira-Corning, NY",
-    "fingerlakes": "Finger Lakes, NY",
-    "glensfalls": "Glens Falls, NY",
-    "hudsonvalley": "Hudson Valley, NY",
-    "ithaca": "Ithaca, NY",
-    "longisland": "Long Island, NY",
-    "newyork": "New York City, NY",
-    "oneonta": "Oneonta, NY",
-    "plattsburgh": "Plattsburgh-Adirondacks, NY",
-    "potsdam": "Potsdam-Canton-Massena, NY",
-    "rochester": "Rochester, NY",
-    "syracuse": "Syracuse, NY",
-    "utica": "Utica-Rome-Oneida, NY",
-    "watertown": "Watertown, NY",
-    "asheville": "Asheville, NC",
-    "boone": "Boone, NC",
-    "charlotte": "Charlotte, NC",
-    "eastnc": "Eastern NC",
-    "fayetteville": "Fayetteville, NC",
-    "greensboro": "Greensboro, NC",
-    "hickory": "Hickory / Lenoir, NC",
-    "onslow": "Jacksonville, NC",
-    "outerbanks": "Outer Banks, NC",
-    "raleigh": "Raleigh / Durham / CH, NC",
-    "wilmington": "Wilmington, NC",
-    "winstonsalem": "Winston-Salem, NC",
-    "bismarck": "Bismarck, ND",
-    "fargo": "Fargo / Moorhead, ND",
-    "grandforks": "Grand Forks, ND",
-    "nd": "North Dakota",
-    "akroncanton": "Akron / Canton, OH",
-    "ashtabula": "Ashtabula, OH",
-    "athensohio": "Athens, OH",
-    "chillicothe": "Chillicothe, OH",
-    "cincinnati": "Cincinnati, OH",
-    "cleveland": "Cleveland, OH",
-    "columbus": "Columbus, OH",
-    "dayton": "Dayton / Springfield, OH",
-    "limaohio": "Lima / Findlay, OH",
-    "mansfield": "Mansfield, OH",
-    "sandusky": "Sandusky, OH",
-    "toledo": "Toledo, OH",
-    "tuscarawas": "Tuscarawas Co, OH",
-    "youngstown": "Youngstown, OH",
-    "zanesville": "Zanesville / Cambridge, OH",
-    "lawton": "Lawton, OK",
-    "enid": "Northwest OK",
-    "oklahomacity": "Oklahoma City, OK",
-    "stillwater": "Stillwater, OK",
-    "tulsa": "Tulsa, OK",
-    "bend": "Bend, OR",
-    "corvallis": "Corvallis/Albany, OR",
-    "eastoregon": "East Oregon, OR",
-    "eugene": "Eugene, OR",
-    "klamath": "Klamath Falls, OR",
-    "medford": "Medford-Ashland, OR",
-    "oregoncoast": "Oregon Coast, OR",
-    "portland": "Portland, OR",
-    "roseburg": "Roseburg, OR",
-    "salem": "Salem, OR",
-    "allentown": "Allentown, PA",
-    "altoona": "Altoona-Johnstown, PA",
-    "chambersburg": "Cumberland Valley, PA",
-    "erie": "Erie, PA",
-    "harrisburg": "Harrisburg, PA",
-    "lancaster": "Lancaster, PA",
-    "meadville": "Meadville, PA",
-    "philadelphia": "Philadelphia, PA",
-    "pittsburgh": "Pittsburgh, PA",
-    "poconos": "Poconos, PA",
-    "reading": "Reading, PA",
-    "scranton": "Scranton / Wilkes-Barre, PA",
-    "pennstate": "State College, PA",
-    "williamsport": "Williamsport, PA",
-    "york": "York, PA",
-    "providence": "Providence / Warwick, RI",
-    "charleston": "Charleston, SC",
-    "columbia": "Columbia, SC",
-    "florencesc": "Florence, SC",
-    "greenville": "Greenville / Upstate, SC",
-    "hiltonhead": "Hilton Head, SC",
-    "myrtlebeach": "Myrtle Beach, SC",
-    "nesd": "Northeast SD",
-    "pierresd": "Pierre / Central SD",
-    "rapidcity": "Rapid City / West SD",
-    "siouxfalls": "Sioux Falls / SE SD",
-    "sd": "South Dakota",
-    "chattanooga": "Chattanooga, TN",
-    "clarksville": "Clarksville, TN",
-    "cookeville": "Cookeville, TN",
-    "jacksontn": "Jackson, TN",
-    "knoxville": "Knoxville, TN",
-    "memphis": "Memphis, TN",
-    "nashville": "Nashville, TN",
-    "tricities": "Tri-Cities, TN",
-    "abilene": "Abilene, TX",
-    "amarillo": "Amarillo, TX",
-    "austin": "Austin, TX",
-    "beaumont": "Beaumont / Port Arthur, TX",
-    "brownsville": "Brownsville, TX",
-    "collegestation": "College Station, TX",
-    "corpuschristi": "Corpus Christi, TX",
-    "dallas": "Dallas / Fort Worth, TX",
-    "nacogdoches": "Deep East Texas, TX",
-    "delrio": "Del Rio / Eagle Pass, TX",
-    "elpaso": "El Paso, TX",
-    "galveston": "Galveston, TX",
-    "houston": "Houston, TX",
-    "killeen": "Killeen / Temple / Ft Hood, TX",
-    "laredo": "Laredo, TX",
-    "lubbock": "Lubbock, TX",
-    "mcallen": "McAllen / Edinburg, TX",
-    "midland": "Midland / Odessa, TX",
-    "sanangelo": "San Angelo, TX",
-    "sanantonio": "San Antonio, TX",
-    "sanmarcos": "San Marcos, TX",
-    "bigbend": "Southwest TX",
-    "texoma": "Texoma, TX",
-    "easttexas": "Tyler / East TX",
-    "victoriatx": "Victoria, TX",
-    "waco": "Waco, TX",
-    "wichitafalls": "Wichita Falls, TX",
-    "logan": "Logan, UT",
-    "ogden": "Ogden-Clearfield, UT",
-    "provo": "Provo / Orem, UT",
-    "saltlakecity": "Salt Lake City, UT",
-    "stgeorge": "St George, UT",
-    "burlington": "Burlington, VT",
-    "charlottesville": "Charlottesville, VA",
-    "danville": "Danville, VA",
-    "fredericksburg": "Fredericksburg, VA",
-    "harrisonburg": "Harrisonburg, VA",
-    "lynchburg": "Lynchburg, VA",
-    "blacksburg": "New River Valley, VA",
-    "norfolk": "Norfolk / Hampton Roads, VA",
-    "richmond": "Richmond, VA",
-    "roanoke": "Roanoke, VA",
-    "swva": "Southwest VA",
-    "winchester": "Winchester, VA",
-    "bellingham": "Bellingham, WA",
-    "kpr": "Kennewick-Pasco-Richland, WA",
-    "moseslake": "Moses Lake, WA",
-    "olympic": "Olympic Peninsula, WA",
-    "pullman": "Pullman / Moscow, WA",
-    "seattle": "Seattle-Tacoma, WA",
-    "skagit": "Skagit / Island / SJI, WA",
-    "spokane": "Spokane / Coeur d'Alene, WA",
-    "wenatchee": "Wenatchee, WA",
-    "yakima": "Yakima, WA",
-    "charlestonwv": "Charleston, WV",
-    "martinsburg": "Eastern Panhandle, WV",
-    "huntington": "Huntington-Ashland, WV",
-    "morgantown": "Morgantown, WV",
-    "ohiovalley": "Northern Panhandle, WV",
-    "parkersburg": "Parkersburg-Marietta, WV",
-    "swv": "Southern WV",
-    "wv": "West Virginia (old)",
-    "wheeling": "Wheeling, WV",
-    "appleton": "Appleton-Oshkosh-FDL, WI",
-    "eauclaire": "Eau Claire, WI",
-    "greenbay": "Green Bay, WI",
-    "janesville": "Janesville, WI",
-    "racine": "Kenosha-Racine, WI",
-    "lacrosse": "La Crosse, WI",
-    "madison": "Madison, WI",
-    "milwaukee": "Milwaukee, WI",
-    "northernwi": "Northern WI",
-    "sheboygan": "Sheboygan, WI",
-    "wausau": "Wausau, WI",
-    "wyoming": "Wyoming",
-    # --- Canada ---
-    "barrie": "Barrie, ON",
-    "calgary": "Calgary, AB",
-    "comoxvalley": "Comox Valley, BC",
-    "edmonton": "Edmonton, AB",
-    "ftmcmurray": "Fort McMurray, AB",
-    "halifax": "Halifax, NS",
-    "hamilton": "Hamilton-Burlington, ON",
-    "kamloops": "Kamloops, BC",
-    "kelowna": "Kelowna / Okanagan, BC",
-    "kingston": "Kingston, ON",
-    "kitchener": "Kitchener-Waterloo-Cambridge, ON",
-    "lethbridge": "Lethbridge, AB",
-    "london": "London, ON",
-    "montreal": "Montreal, QC",
-    "ottawa": "Ottawa-Hull-Gatineau, ON",
-    "pei": "PEI",
-    "quebec": "Quebec City, QC",
-    "regina": "Regina, SK",
-    "saskatoon": "Saskatoon, SK",
-    "soo": "Sault Ste Marie, ON",
-    "stcatharines": "St Catharines, ON",
-    "sudbury": "Sudbury, ON",
-    "thunderbay": "Thunder Bay, ON",
-    "toronto": "Toronto, ON",
-    "vancouver": "Vancouver, BC",
-    "victoria": "Victoria, BC",
-    "whistler": "Whistler, BC",
-    "windsor": "Windsor, ON",
-    "winnipeg": "Winnipeg, MB",
+# Search-result item layouts as (tag, class), most preferred first. A tag of
+# None matches any element with the class.
+_RESULT_LAYOUTS: tuple[tuple[str | None, str], ...] = (
+    ("li", "cl-static-search-result"),  # modern static layout (2024+)
+    ("div", "result-row"),              # legacy layout
+    ("li", "cl-search-result"),         # gallery card layout
+    (None, "result-info"),              # generic fallback
+)
+# One selector matching every layout, so a page is walked only once
+_RESULT_SELECTOR = ", ".join(f"{tag or ''}.{cls}" for tag, cls in _RESULT_LAYOUTS)
+# Per-item selectors shared by the BeautifulSoup and selectolax parsers
+_ITEM_LINK_SEL = "a.titlestring, a.result-title, a.posting-title, .title a, a[href*='/d/']"
+_ITEM_TITLE_SEL = "div.title, .result-title, span.title"
+_ITEM_PRICE_SEL = "div.price, .priceinfo, .result-price, span.price, .price"
+_ITEM_HOOD_SEL = "div.location, .result-hood, .neighborhood, .surlabel, .meta .area"
+_ITEM_DATE_SEL = "time, .result-date, .date, .meta .date"
+# (link, title, price, neighborhood) selectors for a result item, keyed by
+# the _RESULT_LAYOUTS rank of the page. A page uses a single layout, so
+# layouts with well-known markup get direct selectors instead of the
+# catch-all lists; the rest use _GENERIC_ITEM_SELECTORS.
+_GENERIC_ITEM_SELECTORS = (_ITEM_LINK_SEL, _ITEM_TITLE_SEL, _ITEM_PRICE_SEL, _ITEM_HOOD_SEL)
+_LAYOUT_ITEM_SELECTORS: dict[int, tuple[str, str, str, str]] = {
+    # li.cl-static-search-result
+    0: ("a", "div.title", "div.price", "div.location"),
+    # li.cl-search-result
+    2: ("a.posting-title", _ITEM_TITLE_SEL, ".priceinfo", _ITEM_HOOD_SEL),
 }
 
-# ---------------------------------------------------------------------------
-# Craigslist search categories (code -> display name)
-# ---------------------------------------------------------------------------
-
-CATEGORIES: dict[str, str] = {
-    # -- For Sale --
-    "sss": "All For Sale",
-    "ata": "Antiques",
-    "ppa": "Appliances",
-    "ara": "Arts & Crafts",
-    "sna": "ATV/UTV/Snowmobile",
-    "pta": "Auto Parts",
-    "baa": "Baby & Kid Stuff",
-    "bar": "Barter",
-    "haa": "Health & Beauty",
-    "bip": "Bicycle Parts",
-    "bia": "Bicycles",
-    "boa": "Boats",
-    "bka": "Books",
-    "bfa": "Business/Commercial",
-    "cta": "Cars & Trucks",
-    "ema": "CDs/DVDs/VHS",
-    "moa": "Cell Phones",
-    "cla": "Clothing & Accessories",
-    "cba": "Collectibles",
-    "syp": "Computer Parts",
-    "sya": "Computers",
-    "ela": "Electronics",
-    "gra": "Farm & Garden",
-    "zip": "Free Stuff",
-    "fua": "Furniture",
-    "gms": "Garage & Moving Sales",
-    "foa": "General For Sale",
-    "hva": "Heavy Equipment",
-    "hsa": "Household Items",
-    "jwa": "Jewelry",
-    "maa": "Materials",
-    "mca": "Motorcycles/Scooters",
-    "msa": "Musical Instruments",
-    "pha": "Photo/Video",
-    "rva": "Recreational Vehicles",
-    "sga": "Sporting Goods",
-    "tia": "Tickets",
-    "tla": "Tools",
-    "taa": "Toys & Games",
-    "tra": "Trailers",
-    "vga": "Video Gaming",
-    "waa": "Wanted",
-    # -- Housing --
-    "hhh": "All Housing",
-    "apa": "Apartments / Housing For Rent",
-    "swp": "Housing Swap",
-    "hsw": "Housing Wanted",
-    "off": "Office & Commercial",
-    "prk": "Parking & Storage",
-    "rea": "Real Estate For Sale",
-    "roo": "Rooms & Shares",
-    "sha": "Rooms Wanted",
-    "sbw": "Sublets & Temporary",
-    "vac": "Vacation Rentals",
-    # -- Jobs --
-    "jjj": "All Jobs",
-    # -- Services --
-    "bbb": "All Services",
-    # -- Gigs --
-    "ggg": "All Gigs",
-    # -- Community --
-    "ccc": "All Community",
-}
+# Listing-page elements found in one walk by _scan_listing_tree(): the
+# field each element id or class fills (first match in document order wins)
+_DETAIL_ID_FIELDS = {"titletextonly": "title_only", "postingbody": "body", "map": "map", "thumbs": "thumbs"}
+_DETAIL_CLASS_FIELDS = {"postingtitletext": "title", "price": "price", "mapaddress": "location"}
+_MAP_ATTRS_CLASSES = frozenset({"mapAndAttrs"})
+_GALLERY_CLASSES = frozenset({"gallery", "swipe"})
+
+# Patterns used while parsing pages
+_PRICE_RE = re.compile(r"\$[\d,]+")
+# Price + location suffix embedded in a posting title, e.g. "-$1,200(Covington)"
+_TITLE_TAIL_RE = re.compile(r"\s*-?\s*\$[\d,]+\s*(\([^)]*\))?\s*$")
+# Listing URLs, e.g. https://newyork.craigslist.org/mnh/mcy/d/listing-title/1234567890.html
+_LISTING_HREF_RE = re.compile(r"/[a-z]{3}/d/[^/]+/\d+\.html")
+
+# Shared keep-alive client for synchronous fetches; see _get_client().
+_CLIENT: httpx.Client | None = None
+_CLIENT_LOCK = threading.Lock()
+
+# Parsed listing pages by (HTML digest, URL); see _parse_listing_detail_cached()
+_DETAIL_CACHE_SIZE = 128
+_detail_cache: OrderedDict[tuple[bytes, str], dict] = OrderedDict()
+
+# Listing details by URL with the time they were fetched, so repeat
+# requests within LISTING_CACHE_TTL seconds skip the network entirely
+LISTING_CACHE_TTL = 600
+_LISTING_CACHE_SIZE = 256
+_listing_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
 
 # ---------------------------------------------------------------------------
 # Sort options
 # ---------------------------------------------------------------------------
 
-SORT_OPTIONS: dict[str, str] = {
+SORT_OPTIONS: Mapping[str, str] = MappingProxyType({
     "relevant": "Most Relevant",
     "date": "Newest",
     "priceasc": "Price Low to High",
     "pricedsc": "Price High to Low",
-}
+})
+
+# Valid values for the "sort" query parameter
+_SORT_KEYS: frozenset[str] = frozenset(SORT_OPTIONS)
 
 
 # ---------------------------------------------------------------------------
@@ -575,6 +145,58 @@ SORT_OPTIONS: dict[str, str] = {
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=None)
+def _html_parser() -> str:
+    """BeautifulSoup tree builder to use: C-backed lxml, else html.parser."""
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
+@lru_cache(maxsize=None)
+def _lexbor_parser() -> Any:
+    """
+    selectolax's LexborHTMLParser, or None if it is not installed.
+
+    selectolax is an optional accelerator for search-result and listing
+    pages (the "fast" extra); BeautifulSoup is used without it.
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        return None
+    return LexborHTMLParser
+
+
+@lru_cache(maxsize=None)
+def _css(selector: str) -> Any:
+    """
+    ``selector`` compiled by soupsieve, for use on BeautifulSoup trees.
+
+    ``_css(sel).select_one(tag)`` skips the per-call selector handling
+    ``tag.select_one(sel)`` goes through in bs4; the parsers run the same
+    few selectors on every page and every result item.
+    """
+    import soupsieve
+
+    return soupsieve.compile(selector)
+
+
+@lru_cache(maxsize=None)
+def _result_strainer() -> SoupStrainer:
+    """SoupStrainer limiting BeautifulSoup to elements _RESULT_LAYOUTS can match."""
+    from bs4 import SoupStrainer
+
+    # Matched against the whole class attribute: a list of class names here
+    # never matches an element carrying more than one class, so each name
+    # has to be matched as a whitespace-separated token.
+    names = "|".join(re.escape(cls) for _, cls in _RESULT_LAYOUTS)
+    return SoupStrainer(class_=re.compile(rf"(?:^|\s)(?:{names})(?:\s|$)"))
+
+
+@lru_cache(maxsize=256)
 def _build_search_url(
     location: str,
     category: str = "sss",
@@ -589,96 +211,354 @@ def _build_search_url(
     postal_code: str | None = None,
     offset: int = 0,
 ) -> str:
-    """Build a Craigslist search URL with the given parameters."""
+    """
+    Build a Craigslist search URL with the given parameters.
+
+    Raises ValueError for an unknown location or category rather than
+    building a URL that can only 404.
+    """
+    if location not in _VALID_LOCATIONS:
+        raise ValueError(f"Unknown location: {location!r}")
+    if category not in _VALID_CATEGORIES:
+        raise ValueError(f"Unknown category: {category!r}")
+
     base = f"https://{location}.craigslist.org/search/{category}"
-    params: dict[str, Any] = {}
+    # Keys are fixed ASCII and most values are ints, so only the free-text
+    # fields need quoting.
+    parts: list[str] = []
 
     if query:
-        params["query"] = query
+        parts.append(f"query={quote_plus(query)}")
     if min_price is not None:
-        params["min_price"] = min_price
+        parts.append(f"min_price={min_price}")
     if max_price is not None:
-        params["max_price"] = max_price
-    if sort_by and sort_by in SORT_OPTIONS:
-        params["sort"] = sort_by
+        parts.append(f"max_price={max_price}")
+    if sort_by and sort_by in _SORT_KEYS:
+        parts.append(f"sort={sort_by}")
     if has_image:
-        params["hasPic"] = 1
+        parts.append("hasPic=1")
     if posted_today:
-        params["postedToday"] = 1
+        parts.append("postedToday=1")
     if bundle_duplicates:
-        params["bundleDuplicates"] = 1
+        parts.append("bundleDuplicates=1")
     if search_distance is not None:
-        params["search_distance"] = search_distance
+        parts.append(f"search_distance={search_distance}")
     if postal_code:
-        params["postal"] = postal_code
+        parts.append(f"postal={quote_plus(postal_code)}")
+    # Keep the offset last: search_listings appends it to the first page's
+    # URL to build the following pages.
     if offset > 0:
-        params["s"] = offset
+        parts.append(f"s={offset}")
 
-    if params:
-        return f"{base}?{urlencode(params)}"
+    if parts:
+        return f"{base}?{'&'.join(parts)}"
     return base
 
 
-def _fetch_page(url: str) -> str:
-    """Fetch a page and return the HTML content."""
+def _get_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps connections to Craigslist alive between calls
+    instead of paying a fresh TCP + TLS handshake for every page. HTTP/2 is
+    offered so that, where the server supports it, concurrent requests share
+    a single connection.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        import httpx
+
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = httpx.Client(
+                    http2=True,
+                    headers=HEADERS,
+                    timeout=REQUEST_TIMEOUT,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+                )
+                atexit.register(_CLIENT.close)
+    return _CLIENT
+
+
+def _response_html(resp: httpx.Response) -> bytes | str:
+    """
+    Return a response's HTML in the form the parsers handle best.
+
+    UTF-8 pages (all of Craigslist's) and pages with no charset header are
+    passed on as raw bytes, which the parsers decode in C at no extra pass
+    or copy. BeautifulSoup/lxml honor the page's own ``<meta charset>``;
+    selectolax always decodes bytes as UTF-8. Only a page whose header
+    declares some other charset is decoded here, with that charset, since
+    the parsers never see the header.
+    """
+    charset = resp.charset_encoding
+    if charset is None or charset.lower().replace("_", "-") in ("utf-8", "utf8"):
+        return resp.content
+    return resp.text
+
+
+def _fetch_page(url: str) -> bytes | str:
+    """Fetch a page and return its HTML; see :func:`_response_html`."""
+    logger.debug("Fetching URL: %s", url)
+    resp = _get_client().get(url)
+    resp.raise_for_status()
+    return _response_html(resp)
+
+
+async def _fetch_page_async(client: httpx.AsyncClient, url: str) -> bytes | str:
+    """Fetch a page with a shared async client and return its HTML."""
     logger.debug("Fetching URL: %s", url)
-    with httpx.Client(
+    resp = await client.get(url)
+    resp.raise_for_status()
+    return _response_html(resp)
+
+
+class _RateLimiter:
+    """Async token bucket allowing ``rate`` acquisitions per second."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        import asyncio
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        import asyncio
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+async def _fetch_many(
+    urls: list[str],
+    concurrency: int = FETCH_CONCURRENCY,
+    requests_per_second: float | None = None,
+    jitter: float = 0.0,
+) -> list[bytes | str | BaseException]:
+    """
+    Fetch several pages concurrently over one pooled async client.
+
+    At most ``concurrency`` requests are in flight at once. If
+    ``requests_per_second`` is given, requests to each host are additionally
+    throttled to that rate, and each waits a random ``0..jitter`` seconds
+    before going out. Results come back in the order of ``urls``; a failed
+    fetch yields its exception in place of the HTML so one bad URL doesn't
+    sink the whole batch.
+
+    Once a host answers with a throttling status (403/429), the batch's
+    remaining URLs on that host fail with an HTTPStatusError for that
+    response without being requested — hammering a host that is already
+    refusing us only makes the block last longer.
+    """
+    import asyncio
+
+    import httpx
+
+    sem = asyncio.Semaphore(concurrency)
+    limiters: dict[str, _RateLimiter] = {}
+    throttled: dict[str, httpx.Response] = {}
+
+    async with httpx.AsyncClient(
+        http2=True,
         headers=HEADERS,
         timeout=REQUEST_TIMEOUT,
         follow_redirects=True,
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
     ) as client:
-        resp = client.get(url)
-        resp.raise_for_status()
-        return resp.text
 
+        async def fetch(url: str) -> bytes | str:
+            host = urlparse(url).netloc
+            if requests_per_second:
+                if host not in limiters:
+                    limiters[host] = _RateLimiter(requests_per_second)
+                await limiters[host].acquire()
+            if jitter:
+                await asyncio.sleep(random.uniform(0, jitter))
+            async with sem:
+                # Checked after the waits, as the host may have started
+                # throttling while this request was queued
+                if host in throttled:
+                    # A fresh error per URL: re-raising one shared exception
+                    # from every coroutine keeps growing its traceback
+                    resp = throttled[host]
+                    raise httpx.HTTPStatusError(
+                        f"{host} is throttling requests (HTTP {resp.status_code}); {url} was not requested",
+                        request=client.build_request("GET", url),
+                        response=resp,
+                    )
+                try:
+                    return await _fetch_page_async(client, url)
+                except httpx.HTTPStatusError as exc:
+                    if exc.response.status_code in _THROTTLED_STATUSES:
+                        throttled.setdefault(host, exc.response)
+                    raise
+
+        return await asyncio.gather(*(fetch(u) for u in urls), return_exceptions=True)
+
+
+def _fetch_pages(urls: list[str], concurrency: int = FETCH_CONCURRENCY) -> list[bytes | str | Exception]:
+    """
+    Fetch several pages concurrently over the shared keep-alive client.
+
+    Used for the follow-up pages of a search, right after its first page
+    came through :func:`_get_client`: going through the same client from a
+    few threads reuses that warm connection (multiplexed, over HTTP/2)
+    instead of a throwaway async client's fresh TCP + TLS setup. Results
+    come back in the order of ``urls``, with a failed fetch's exception in
+    place of its HTML.
+    """
+    from concurrent.futures import ThreadPoolExecutor
 
-def _parse_search_results(html: str, location: str) -> list[dict]:
-    """Parse Craigslist search results HTML into a list of listing dicts."""
-    soup = BeautifulSoup(html, "html.parser")
-    results: list[dict] = []
+    def fetch(url: str) -> bytes | str | Exception:
+        try:
+            return _fetch_page(url)
+        except Exception as exc:
+            return exc
 
-    # Modern Craigslist (2024+) uses <li class="cl-static-search-result">
-    # or <div class="cl-search-result"> patterns
-    listings = soup.select("li.cl-static-search-result")
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(urls))) as pool:
+        return list(pool.map(fetch, urls))
 
-    if not listings:
-        # Try alternate selectors for different page structures
-        listings = soup.select("div.result-row")
 
-    if not listings:
-        # Try the gallery card layout
-        listings = soup.select("li.cl-search-result")
+def _parse_search_results(html: bytes | str, location: str) -> list[dict]:
+    """Parse Craigslist search results HTML into a list of listing dicts."""
+    if _lexbor_parser() is not None:
+        return _parse_search_results_fast(html, location)
+
+    from bs4 import BeautifulSoup
 
-    if not listings:
-        # Try even more generic approach
-        listings = soup.select(".result-info")
+    # Only build the result items' subtrees; headers, scripts and footers
+    # are skipped at parse time.
+    soup = BeautifulSoup(html, _html_parser(), parse_only=_result_strainer())
+    results: list[dict] = []
+
+    # Modern Craigslist (2024+) uses <li class="cl-static-search-result">;
+    # keep only the items of the most preferred layout present.
+    listings, rank = _pick_layout(
+        _css(_RESULT_SELECTOR).select(soup),
+        lambda el: (el.name, el.get("class") or ()),
+    )
+    selectors = _LAYOUT_ITEM_SELECTORS.get(rank, _GENERIC_ITEM_SELECTORS)
 
     for item in listings:
         try:
-            listing = _parse_single_result(item, location)
+            listing = _parse_single_result(item, location, selectors)
             if listing:
                 results.append(listing)
         except Exception as e:
             logger.debug("Error parsing listing: %s", e)
             continue
 
+    # The results hold plain strings only, so the tree can go now
+    _release_soup(soup)
+
     # If none of the structured selectors work, try finding all links
-    # that look like listing URLs
+    # that look like listing URLs (needs the whole document)
     if not results:
-        results = _parse_results_fallback(soup, location)
+        results = _parse_results_fallback_html(html, location)
 
     return results
 
 
-def _parse_single_result(item: Any, location: str) -> dict | None:
-    """Parse a single search result element into a dict."""
-    result: dict[str, Any] = {}
+def _release_soup(soup: BeautifulSoup) -> None:
+    """
+    Free a parse tree now instead of at the next cyclic GC pass.
+
+    Elements link to their parents and neighbours, so a dropped tree is
+    otherwise only reclaimed by the cycle collector — and a long-running
+    server would keep several page-sized trees around between passes.
+    ``decompose()`` wipes those links; it is applied to the top-level
+    nodes because on the BeautifulSoup object itself it stops at the root.
+    """
+    for el in list(soup.contents):
+        el.decompose()
+
+
+def _layout_rank(tag: str, classes: Any) -> int:
+    """Index of the first entry in _RESULT_LAYOUTS an element matches."""
+    for rank, (layout_tag, layout_cls) in enumerate(_RESULT_LAYOUTS):
+        if layout_cls in classes and (layout_tag is None or layout_tag == tag):
+            return rank
+    return len(_RESULT_LAYOUTS)
+
+
+def _pick_layout(candidates: list[Any], describe: Any) -> tuple[list[Any], int]:
+    """
+    Reduce matches of _RESULT_SELECTOR to the most preferred layout present.
+
+    ``describe`` maps an element to its ``(tag, classes)``. This gives the
+    same items as trying each layout selector in turn, without walking the
+    tree once per layout, and drops nested matches such as a
+    ``.result-info`` inside a ``div.result-row``. Returns the items and
+    the layout's rank in _RESULT_LAYOUTS.
+    """
+    if not candidates:
+        return [], len(_RESULT_LAYOUTS)
+    ranks = [_layout_rank(*describe(el)) for el in candidates]
+    best = min(ranks)
+    return [el for el, rank in zip(candidates, ranks) if rank == best], best
+
+
+def _split_title_text(
+    raw_text: str,
+    price: str | None,
+    neighborhood: str | None,
+) -> tuple[str, str | None, str | None]:
+    """
+    Recover a listing title from the raw text of its link.
+
+    Used when a result has no dedicated title element. If no price element
+    was found either, the price (and anything after it, as neighborhood) is
+    split out of the text. Returns ``(title, price, neighborhood)``.
+    """
+    if price is None:
+        # No child elements at all — split on price pattern
+        price_match = _PRICE_RE.search(raw_text)
+        if not price_match:
+            return raw_text, None, neighborhood
+        before_price = raw_text[: price_match.start()].strip()
+        after_price = raw_text[price_match.end() :].strip()
+        if after_price and neighborhood is None:
+            neighborhood = after_price
+        return before_price or raw_text, price_match.group(0), neighborhood
+
+    # Have price but no title element — strip price from raw text
+    clean = raw_text.replace(price, "").strip()
+    if neighborhood is not None:
+        clean = clean.replace(neighborhood, "").strip()
+    return clean or raw_text, price, neighborhood
+
+
+def _parse_single_result(
+    item: Any,
+    location: str,
+    selectors: tuple[str, str, str, str] = _GENERIC_ITEM_SELECTORS,
+) -> dict | None:
+    """
+    Parse a single search result element into a dict.
+
+    ``selectors`` are the item's (link, title, price, neighborhood)
+    selectors, from _LAYOUT_ITEM_SELECTORS for the page's layout.
+    """
+    link_sel, title_sel, price_sel, hood_sel = selectors
 
     # Try to find the title/link
-    title_el = item.select_one("a.titlestring, a.result-title, a.posting-title, .title a, a[href*='/d/']")
+    title_el = _css(link_sel).select_one(item)
     if not title_el:
         # For cl-static-search-result, the link is the <a> child
-        title_el = item.select_one("a")
+        title_el = _css("a").select_one(item)
 
     if not title_el:
         return None
@@ -686,66 +566,132 @@ def _parse_single_result(item: Any, location: str) -> dict | None:
     href = title_el.get("href", "")
     if href and not href.startswith("http"):
         href = f"https://{location}.craigslist.org{href}"
-    result["url"] = href
 
     # --- Try dedicated child elements first (modern CL layout) ---
     # cl-static-search-result often has .title, .price, .location divs
-    title_div = item.select_one("div.title, .result-title, span.title")
-    price_el = item.select_one("div.price, .priceinfo, .result-price, span.price, .price")
-    hood_el = item.select_one("div.location, .result-hood, .neighborhood, .surlabel, .meta .area")
+    title_div = _css(title_sel).select_one(item)
+    price_el = _css(price_sel).select_one(item)
+    hood_el = _css(hood_sel).select_one(item)
 
-    if title_div:
-        result["title"] = title_div.get_text(strip=True)
-    if price_el:
-        result["price"] = price_el.get_text(strip=True)
-    if hood_el:
-        result["neighborhood"] = hood_el.get_text(strip=True).strip("() ")
+    title = title_div.get_text(strip=True) if title_div else None
+    price = price_el.get_text(strip=True) if price_el else None
+    neighborhood = hood_el.get_text(strip=True).strip("() ") if hood_el else None
 
     # --- Fallback: if we couldn't get structured children, parse from raw text ---
-    raw_text = title_el.get_text(strip=True)
-
-    if "title" not in result or not result.get("title"):
-        if "price" not in result:
-            # No child elements at all — split on price pattern
-            price_match = re.search(r"(\$[\d,]+)", raw_text)
-            if price_match:
-                result["price"] = price_match.group(1)
-                before_price = raw_text[: price_match.start()].strip()
-                after_price = raw_text[price_match.end() :].strip()
-                result["title"] = before_price or raw_text
-                if after_price and "neighborhood" not in result:
-                    result["neighborhood"] = after_price
-            else:
-                result["title"] = raw_text
-                result["price"] = None
-        else:
-            # Have price but no title div — strip price from raw text
-            price_text = result["price"]
-            clean = raw_text.replace(price_text, "").strip()
-            if "neighborhood" in result:
-                clean = clean.replace(result["neighborhood"], "").strip()
-            result["title"] = clean if clean else raw_text
-
-    # Ensure all keys exist
-    result.setdefault("title", raw_text)
-    result.setdefault("price", None)
-    result.setdefault("neighborhood", None)
+    # The link's full text is only walked here; with a title element present
+    # (the common, modern layout) it is never needed.
+    if not title:
+        title, price, neighborhood = _split_title_text(
+            title_el.get_text(strip=True), price, neighborhood,
+        )
 
     # Try to extract date
-    date_el = item.select_one("time, .result-date, .date, .meta .date")
+    date_el = _css(_ITEM_DATE_SEL).select_one(item)
+    date = None
     if date_el:
-        result["date"] = date_el.get("datetime") or date_el.get_text(strip=True)
-    else:
-        result["date"] = None
+        date = date_el.get("datetime") or date_el.get_text(strip=True)
 
     # Try to extract image
-    img_el = item.select_one("img")
+    img_el = _css("img").select_one(item)
+    thumbnail = None
     if img_el:
-        result["thumbnail"] = img_el.get("src") or img_el.get("data-src")
-    else:
-        result["thumbnail"] = None
+        thumbnail = img_el.get("src") or img_el.get("data-src")
 
-    return result
+    return {
+        "url": href,
+        "title": title,
+        "price": price,
+        "neighborhood": neighborhood,
+        "date": date,
+        "thumbnail": thumbnail,
+    }
+
+
+def _parse_search_results_fast(html: bytes | str, location: str) -> list[dict]:
+    """selectolax version of :func:`_parse_search_results`.
+
+    Produces the same dicts; only the link-scanning fallback for unknown
+    layouts still goes through BeautifulSoup.
+    """
+    tree = _lexbor_parser()(html)
+    results: list[dict] = []
+
+    listings, rank = _pick_layout(
+        tree.css(_RESULT_SELECTOR),
+        lambda node: (node.tag, (node.attributes.get("class") or "").split()),
+    )
+    selectors = _LAYOUT_ITEM_SELECTORS.get(rank, _GENERIC_ITEM_SELECTORS)
+
+    for item in listings:
+        try:
+            listing = _parse_single_result_fast(item, location, selectors)
+            if listing:
+                results.append(listing)
+        except Exception as e:
+            logger.debug("Error parsing listing: %s", e)
+            continue
+
+    if not results:
+        results = _parse_results_fallback_html(html, location)
+
+    return results
+
+
+def _parse_single_result_fast(
+    item: Any,
+    location: str,
+    selectors: tuple[str, str, str, str] = _GENERIC_ITEM_SELECTORS,
+) -> dict | None:
+    """selectolax version of :func:`_parse_single_result`."""
+    link_sel, title_sel, price_sel, hood_sel = selectors
+
+    title_el = item.css_first(link_sel) or item.css_first("a")
+    if title_el is None:
+        return None
+
+    href = title_el.attributes.get("href") or ""
+    if href and not href.startswith("http"):
+        href = f"https://{location}.craigslist.org{href}"
+
+    title_div = item.css_first(title_sel)
+    price_el = item.css_first(price_sel)
+    hood_el = item.css_first(hood_sel)
+
+    title = title_div.text(strip=True) if title_div is not None else None
+    price = price_el.text(strip=True) if price_el is not None else None
+    neighborhood = hood_el.text(strip=True).strip("() ") if hood_el is not None else None
+
+    if not title:
+        title, price, neighborhood = _split_title_text(title_el.text(strip=True), price, neighborhood)
+
+    date_el = item.css_first(_ITEM_DATE_SEL)
+    date = None
+    if date_el is not None:
+        date = date_el.attributes.get("datetime") or date_el.text(strip=True)
+
+    img_el = item.css_first("img")
+    thumbnail = None
+    if img_el is not None:
+        thumbnail = img_el.attributes.get("src") or img_el.attributes.get("data-src")
+
+    return {
+        "url": href,
+        "title": title,
+        "price": price,
+        "neighborhood": neighborhood,
+        "date": date,
+        "thumbnail": thumbnail,
+    }
+
+
+def _parse_results_fallback_html(html: bytes | str, location: str) -> list[dict]:
+    """Run :func:`_parse_results_fallback` over a full parse of ``html``."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, _html_parser())
+    results = _parse_results_fallback(soup, location)
+    _release_soup(soup)
+    return results
 
 
 def _parse_results_fallback(soup: BeautifulSoup, location: str) -> list[dict]:
@@ -754,10 +700,10 @@ def _parse_results_fallback(soup: BeautifulSoup, location: str) -> list[dict]:
     seen_urls: set[str] = set()
 
     # Look for links that match craigslist listing URL patterns
-    # e.g. https://newyork.craigslist.org/mnh/mcy/d/listing-title/1234567890.html
-    pattern = re.compile(r"/[a-z]{3}/d/[^/]+/\d+\.html")
+    for a_tag in soup.find_all("a", href=_LISTING_HREF_RE):
+        if len(results) >= MAX_RESULTS:
+            break
 
-    for a_tag in soup.find_all("a", href=pattern):
         href = a_tag.get("href", "")
         if not href.startswith("http"):
             href = f"https://{location}.craigslist.org{href}"
@@ -770,11 +716,13 @@ def _parse_results_fallback(soup: BeautifulSoup, location: str) -> list[dict]:
         if not title or len(title) < 3:
             continue
 
-        # Try to find price near this element
+        # Try to find price near this element. Only the first few strings of
+        # the parent are read — on link-dense pages the parent can be a huge
+        # container, and walking all of it for every link goes quadratic.
         parent = a_tag.parent
         price = None
         if parent:
-            price_match = re.search(r"\$[\d,]+", parent.get_text())
+            price_match = _PRICE_RE.search(" ".join(islice(parent.stripped_strings, 20)))
             if price_match:
                 price = price_match.group(0)
 
@@ -790,38 +738,182 @@ def _parse_results_fallback(soup: BeautifulSoup, location: str) -> list[dict]:
     return results
 
 
-def _parse_listing_detail(html: str, url: str) -> dict:
+@lru_cache(maxsize=1024)
+def _norm_attr_key(label: str) -> str:
+    """Normalize an attribute label, e.g. ``"Paint color:"`` -> ``"paint color"``.
+
+    Listings reuse a small vocabulary of labels, so nearly every call is a
+    cache hit.
+    """
+    return label.rstrip(":").strip().lower()
+
+
+def _soup_text(el: Any, separator: str = "") -> str:
+    """Stripped text of a BeautifulSoup element."""
+    return el.get_text(separator, strip=True)
+
+
+def _lexbor_text(node: Any, separator: str = "") -> str:
+    """
+    Stripped text of a selectolax node, matching :func:`_soup_text`.
+
+    Lexbor keeps whitespace-only fragments, so with a separator they are
+    dropped by hand to avoid doubled separators.
+    """
+    if not separator:
+        return node.text(strip=True)
+    parts = (n.text_content.strip() for n in node.traverse(include_text=True) if n.tag == "-text")
+    return separator.join(part for part in parts if part)
+
+
+def _collect_attrs(
+    spans: Iterator[tuple[Any, frozenset[str]]],
+    text: Callable[[Any, str], str],
+    attrs: dict[str, str],
+) -> None:
+    """
+    Add the attributes spelled out by one .attrgroup's spans to ``attrs``.
+
+    Craigslist uses paired <span class="labl"> / <span class="valu">
+    siblings, plus standalone value and "key: value" spans. ``spans``
+    yields each span with its class set in document order, walked with one
+    item of lookahead so a label can claim the value span that follows it;
+    ``text(span, separator)`` returns a span's stripped text.
+    """
+    following = next(spans, None)
+    while following is not None:
+        span, classes = following
+        following = next(spans, None)
+
+        if "labl" in classes:
+            # This is a label span — the next sibling should be the value
+            label = _norm_attr_key(text(span, ""))
+            if following is not None and "valu" in following[1]:
+                val = text(following[0], "")
+                if label and val:
+                    attrs[label] = val
+                following = next(spans, None)
+                continue
+            elif label:
+                attrs[label] = ""
+        elif "valu" in classes:
+            # Standalone value span (no preceding label)
+            val = text(span, "")
+            # Check for special classes like "year", "makemodel"
+            if "year" in classes and val:
+                attrs["year"] = val
+            elif "makemodel" in classes and val:
+                attrs["make/model"] = val
+            elif val:
+                # Could be a note like "odometer broken"
+                attrs[val.lower()] = "yes"
+        else:
+            # Generic span — try key:value or standalone
+            raw = text(span, " ")
+            if ":" in raw:
+                key, _, val = raw.partition(":")
+                key = _norm_attr_key(key)
+                val = val.strip()
+                if key and val:
+                    attrs[key] = val
+            elif raw:
+                attrs[raw.lower()] = "yes"
+
+
+def _has_ancestor_class(el: Any, classes: frozenset[str], tag: str | None = None) -> bool:
+    """Whether an ancestor of ``el`` (a ``tag`` element, if given) has one of ``classes``."""
+    for parent in el.parents:
+        if (tag is None or parent.name == tag) and not classes.isdisjoint(parent.get("class") or ()):
+            return True
+    return False
+
+
+def _scan_listing_tree(soup: BeautifulSoup) -> tuple[dict[str, Any], list[Any], list[Any]]:
+    """
+    Find the listing-page elements :func:`_parse_listing_detail` reads, in one walk.
+
+    Replaces a dozen separate selector queries, each of which walked the
+    tree in Python until it matched. Returns the first element for each
+    field (see _DETAIL_ID_FIELDS / _DETAIL_CLASS_FIELDS, plus "page_title"
+    and "posted"), the .attrgroup elements, and the image elements matching
+    ``a.thumb, .gallery img, .swipe img``, all in document order.
+    """
+    found: dict[str, Any] = {}
+    groups: list[Any] = []
+    images: list[Any] = []
+
+    for el in soup.find_all(True):
+        name = el.name
+        attrs = el.attrs
+        el_id = attrs.get("id")
+        if el_id in _DETAIL_ID_FIELDS:
+            found.setdefault(_DETAIL_ID_FIELDS[el_id], el)
+        classes = attrs.get("class") or ()
+        for cls in classes:
+            if cls in _DETAIL_CLASS_FIELDS:
+                found.setdefault(_DETAIL_CLASS_FIELDS[cls], el)
+        if "attrgroup" in classes:
+            groups.append(el)
+
+        if name == "h1":
+            if "postingtitle" in classes:
+                found.setdefault("title", el)
+        elif name == "time":
+            if "date" in classes or "timeago" in classes:
+                found.setdefault("posted", el)
+        elif name == "small":
+            if "location" not in found and _has_ancestor_class(el, _MAP_ATTRS_CLASSES, "div"):
+                found["location"] = el
+        elif name == "a":
+            if "thumb" in classes:
+                images.append(el)
+        elif name == "img":
+            if _has_ancestor_class(el, _GALLERY_CLASSES):
+                images.append(el)
+        elif name == "title":
+            found.setdefault("page_title", el)
+
+    return found, groups, images
+
+
+def _parse_listing_detail(html: bytes | str, url: str) -> dict:
     """Parse a single Craigslist listing page into a detail dict."""
-    soup = BeautifulSoup(html, "html.parser")
+    if _lexbor_parser() is not None:
+        return _parse_listing_detail_fast(html, url)
+
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, _html_parser())
+    found, groups, image_els = _scan_listing_tree(soup)
     result: dict[str, Any] = {"url": url}
 
     # Title — prefer the text-only element to avoid price/location in it
-    title_only_el = soup.select_one("#titletextonly")
+    title_only_el = found.get("title_only")
     if title_only_el:
         result["title"] = title_only_el.get_text(strip=True)
     else:
-        title_el = soup.select_one(".postingtitletext, h1.postingtitle")
+        title_el = found.get("title")
         if title_el:
             raw = title_el.get_text(strip=True)
             # Strip embedded price + location suffix like "-$1,200(Covington)"
-            cleaned = re.sub(r"\s*-?\s*\$[\d,]+\s*(\([^)]*\))?\s*$", "", raw).strip()
+            cleaned = _TITLE_TAIL_RE.sub("", raw).strip()
             result["title"] = cleaned if cleaned else raw
         else:
-            title_el = soup.select_one("title")
+            title_el = found.get("page_title")
             result["title"] = title_el.get_text(strip=True) if title_el else "Unknown"
 
     # Price
-    price_el = soup.select_one(".price, .postingtitletext .price")
+    price_el = found.get("price")
     if price_el:
         result["price"] = price_el.get_text(strip=True)
     else:
         result["price"] = None
 
     # Body / description
-    body_el = soup.select_one("#postingbody")
+    body_el = found.get("body")
     if body_el:
         # Remove the "QR Code Link to This Post" text
-        for qr in body_el.select(".print-information"):
+        for qr in _css(".print-information").select(body_el):
             qr.decompose()
         result["description"] = body_el.get_text(strip=True)
     else:
@@ -830,59 +922,24 @@ def _parse_listing_detail(html: str, url: str) -> dict:
     # Attributes (condition, make, model, etc.)
     # Craigslist uses paired <span class="labl"> / <span class="valu"> siblings
     attrs: dict[str, str] = {}
-    for group in soup.select(".attrgroup"):
-        spans = group.select("span")
-        i = 0
-        while i < len(spans):
-            span = spans[i]
-            classes = span.get("class", [])
-
-            if "labl" in classes:
-                # This is a label span — the next sibling should be the value
-                label = span.get_text(strip=True).rstrip(":").strip().lower()
-                if i + 1 < len(spans) and "valu" in spans[i + 1].get("class", []):
-                    val = spans[i + 1].get_text(strip=True)
-                    if label and val:
-                        attrs[label] = val
-                    i += 2
-                    continue
-                elif label:
-                    attrs[label] = ""
-            elif "valu" in classes:
-                # Standalone value span (no preceding label)
-                val = span.get_text(strip=True)
-                # Check for special classes like "year", "makemodel"
-                if "year" in classes and val:
-                    attrs["year"] = val
-                elif "makemodel" in classes and val:
-                    attrs["make/model"] = val
-                elif val:
-                    # Could be a note like "odometer broken"
-                    attrs[val.lower()] = "yes"
-            else:
-                # Generic span — try key:value or standalone
-                text = span.get_text(" ", strip=True)
-                if ":" in text:
-                    key, _, val = text.partition(":")
-                    key = key.strip().lower()
-                    val = val.strip()
-                    if key and val:
-                        attrs[key] = val
-                elif text:
-                    attrs[text.lower()] = "yes"
-            i += 1
+    for group in groups:
+        _collect_attrs(
+            ((sp, frozenset(sp.get("class") or ())) for sp in group.find_all("span")),
+            _soup_text,
+            attrs,
+        )
     result["attributes"] = attrs if attrs else None
 
     # Location
     # Try map address
-    map_addr = soup.select_one(".mapaddress, div.mapAndAttrs small")
+    map_addr = found.get("location")
     if map_addr:
         result["location"] = map_addr.get_text(strip=True)
     else:
         result["location"] = None
 
     # Google Maps link (lat/long)
-    map_el = soup.select_one("#map")
+    map_el = found.get("map")
     if map_el:
         lat = map_el.get("data-latitude")
         lon = map_el.get("data-longitude")
@@ -891,7 +948,7 @@ def _parse_listing_detail(html: str, url: str) -> dict:
             result["longitude"] = float(lon)
 
     # Posted date
-    time_el = soup.select_one("time.date, time.timeago")
+    time_el = found.get("posted")
     if time_el:
         result["posted"] = time_el.get("datetime") or time_el.get_text(strip=True)
     else:
@@ -899,22 +956,173 @@ def _parse_listing_detail(html: str, url: str) -> dict:
 
     # Images
     images: list[str] = []
-    for img_link in soup.select("a.thumb, .gallery img, .swipe img"):
+    seen_images: set[str] = set()
+    for img_link in image_els:
         src = img_link.get("href") or img_link.get("src") or img_link.get("data-src")
-        if src and src not in images:
+        if src and src not in seen_images:
+            seen_images.add(src)
             images.append(src)
     # Also check the thumbs data attribute
-    thumb_div = soup.select_one("#thumbs")
+    thumb_div = found.get("thumbs")
     if thumb_div:
-        for a_tag in thumb_div.select("a"):
+        for a_tag in _css("a").select(thumb_div):
             href = a_tag.get("href")
-            if href and href not in images:
+            if href and href not in seen_images:
+                seen_images.add(href)
                 images.append(href)
     result["images"] = images if images else None
 
+    # Everything in result is a plain string, so the tree can go now
+    _release_soup(soup)
+    return result
+
+
+def _parse_listing_detail_fast(html: bytes | str, url: str) -> dict:
+    """selectolax version of :func:`_parse_listing_detail`."""
+    tree = _lexbor_parser()(html)
+    result: dict[str, Any] = {"url": url}
+
+    title_only_el = tree.css_first("#titletextonly")
+    if title_only_el is not None:
+        result["title"] = title_only_el.text(strip=True)
+    else:
+        title_el = tree.css_first(".postingtitletext, h1.postingtitle")
+        if title_el is not None:
+            raw = title_el.text(strip=True)
+            cleaned = _TITLE_TAIL_RE.sub("", raw).strip()
+            result["title"] = cleaned if cleaned else raw
+        else:
+            title_el = tree.css_first("title")
+            result["title"] = title_el.text(strip=True) if title_el is not None else "Unknown"
+
+    price_el = tree.css_first(".price, .postingtitletext .price")
+    result["price"] = price_el.text(strip=True) if price_el is not None else None
+
+    body_el = tree.css_first("#postingbody")
+    if body_el is not None:
+        # BeautifulSoup's get_text() leaves out script/style contents;
+        # Lexbor's text() does not, so drop those nodes along with the QR text
+        for el in body_el.css(".print-information, script, style"):
+            el.decompose()
+        result["description"] = body_el.text(strip=True)
+    else:
+        result["description"] = None
+
+    attrs: dict[str, str] = {}
+    for group in tree.css(".attrgroup"):
+        _collect_attrs(
+            ((sp, frozenset((sp.attributes.get("class") or "").split())) for sp in group.css("span")),
+            _lexbor_text,
+            attrs,
+        )
+    result["attributes"] = attrs if attrs else None
+
+    map_addr = tree.css_first(".mapaddress, div.mapAndAttrs small")
+    result["location"] = map_addr.text(strip=True) if map_addr is not None else None
+
+    map_el = tree.css_first("#map")
+    if map_el is not None:
+        lat = map_el.attributes.get("data-latitude")
+        lon = map_el.attributes.get("data-longitude")
+        if lat and lon:
+            result["latitude"] = float(lat)
+            result["longitude"] = float(lon)
+
+    time_el = tree.css_first("time.date, time.timeago")
+    result["posted"] = None
+    if time_el is not None:
+        result["posted"] = time_el.attributes.get("datetime") or time_el.text(strip=True)
+
+    images: list[str] = []
+    seen_images: set[str] = set()
+    for img_link in tree.css("a.thumb, .gallery img, .swipe img"):
+        attributes = img_link.attributes
+        src = attributes.get("href") or attributes.get("src") or attributes.get("data-src")
+        if src and src not in seen_images:
+            seen_images.add(src)
+            images.append(src)
+    thumb_div = tree.css_first("#thumbs")
+    if thumb_div is not None:
+        for a_tag in thumb_div.css("a"):
+            href = a_tag.attributes.get("href")
+            if href and href not in seen_images:
+                seen_images.add(href)
+                images.append(href)
+    result["images"] = images if images else None
+
+    return result
+
+
+def _fetch_error(exc: Exception, url: str) -> dict:
+    """Build the error dict returned to callers when fetching ``url`` failed."""
+    import httpx
+
+    if isinstance(exc, httpx.HTTPStatusError):
+        return {"error": f"HTTP error {exc.response.status_code}: {exc.response.reason_phrase}", "url": url}
+    return {"error": f"Request failed: {exc}", "url": url}
+
+
+def _get_cached_listing(url: str) -> dict | None:
+    """Return the details fetched for ``url`` within the TTL, if any."""
+    entry = _listing_cache.get(url)
+    if entry is None:
+        return None
+    fetched_at, result = entry
+    if time.monotonic() - fetched_at > LISTING_CACHE_TTL:
+        del _listing_cache[url]
+        return None
+    _listing_cache.move_to_end(url)
+    return result
+
+
+def _cache_listing(url: str, result: dict) -> None:
+    """Remember successfully fetched details for ``url``; errors are never cached."""
+    _listing_cache[url] = (time.monotonic(), result)
+    _listing_cache.move_to_end(url)
+    if len(_listing_cache) > _LISTING_CACHE_SIZE:
+        _listing_cache.popitem(last=False)
+
+
+def _parse_listing_detail_cached(html: bytes | str, url: str) -> dict:
+    """
+    Memoized :func:`_parse_listing_detail`, keyed by a digest of the HTML.
+
+    Re-fetching an unchanged listing skips the parse entirely. Keying on
+    the digest rather than the page keeps the cache from holding on to up
+    to _DETAIL_CACHE_SIZE full HTML documents. The returned dict is shared
+    between hits, so treat it as read-only.
+    """
+    key = _detail_cache_key(html, url)
+    cached = _get_cached_detail(key)
+    if cached is not None:
+        return cached
+
+    result = _parse_listing_detail(html, url)
+    _cache_detail(key, result)
     return result
 
 
+def _detail_cache_key(html: bytes | str, url: str) -> tuple[bytes, str]:
+    """Return the _detail_cache key for ``html`` fetched from ``url``."""
+    data = html if isinstance(html, bytes) else html.encode()
+    return hashlib.blake2b(data, digest_size=16).digest(), url
+
+
+def _get_cached_detail(key: tuple[bytes, str]) -> dict | None:
+    """Return the details parsed from the page ``key`` names, if still cached."""
+    cached = _detail_cache.get(key)
+    if cached is not None:
+        _detail_cache.move_to_end(key)
+    return cached
+
+
+def _cache_detail(key: tuple[bytes, str], result: dict) -> None:
+    """Remember the details parsed from the page ``key`` names."""
+    _detail_cache[key] = result
+    if len(_detail_cache) > _DETAIL_CACHE_SIZE:
+        _detail_cache.popitem(last=False)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -947,12 +1155,14 @@ def search_listings(
       - total_results: approximate number of results found
       - results: list of listing dicts
     """
+    import httpx
+
     loc = location.lower().strip()
-    if loc not in LOCATIONS:
+    if loc not in _VALID_LOCATIONS:
         # Try to find a matching location
-        matches = [k for k, v in LOCATIONS.items() if loc in k or loc in v.lower()]
-        if matches:
-            loc = matches[0]
+        match = next((k for k, name in _LOCATIONS_LOWER if loc in k or loc in name), None)
+        if match is not None:
+            loc = match
         else:
             return {
                 "error": f"Unknown location: '{location}'. Use list_locations to see valid options.",
@@ -960,55 +1170,15 @@ def search_listings(
             }
 
     cat = category.lower().strip()
-    if cat not in CATEGORIES:
+    if cat not in _VALID_CATEGORIES:
         return {
             "error": f"Unknown category: '{category}'. Use list_categories to see valid options.",
             "suggestion": "Try 'sss' (All For Sale), 'mca' (Motorcycles), 'cta' (Cars & Trucks), etc.",
         }
 
-    all_results: list[dict] = []
-    offset = 0
-    url = ""
-
-    while len(all_results) < max_results:
-        url = _build_search_url(
-            location=loc,
-            category=cat,
-            query=query,
-            min_price=min_price,
-            max_price=max_price,
-            sort_by=sort_by,
-            has_image=has_image,
-            posted_today=posted_today,
-            bundle_duplicates=bundle_duplicates,
-            search_distance=search_distance,
-            postal_code=postal_code,
-            offset=offset,
-        )
-
-        try:
-            html = _fetch_page(url)
-        except httpx.HTTPStatusError as e:
-            return {"error": f"HTTP error {e.response.status_code}: {e.response.reason_phrase}", "url": url}
-        except httpx.RequestError as e:
-            return {"error": f"Request failed: {e}", "url": url}
-
-        page_results = _parse_search_results(html, loc)
-
-        if not page_results:
-            break
-
-        all_results.extend(page_results)
-        offset += len(page_results)
-
-        # Craigslist typically returns ~120 results per page
-        if len(page_results) < 20:
-            break
-
-    # Trim to max_results
-    all_results = all_results[:max_results]
-
-    # Build first page URL for reference
+    # The first page is fetched on its own: its size tells us where the
+    # following pages start (Craigslist typically returns ~120 results per
+    # page), and usually it is the only page needed.
     first_url = _build_search_url(
         location=loc,
         category=cat,
@@ -1022,6 +1192,35 @@ def search_listings(
         search_distance=search_distance,
         postal_code=postal_code,
     )
+    try:
+        html = _fetch_page(first_url)
+    except (httpx.HTTPStatusError, httpx.RequestError) as e:
+        return _fetch_error(e, first_url)
+    all_results = _parse_search_results(html, loc)
+
+    page_size = len(all_results)
+    if page_size >= 20 and page_size < max_results:
+        # Any further pages are fetched concurrently, then consumed in order
+        # with the same stopping rules as the first.
+        # The offset is always the last parameter _build_search_url writes,
+        # so the first page's URL serves as a template for the rest.
+        page_count = -(-max_results // page_size)
+        sep = "&" if "?" in first_url else "?"
+        urls = [f"{first_url}{sep}s={n * page_size}" for n in range(1, page_count)]
+        pages = _fetch_pages(urls)
+
+        for url, page in zip(urls, pages):
+            if isinstance(page, Exception):
+                return _fetch_error(page, url)
+            page_results = _parse_search_results(page, loc)
+            if not page_results:
+                break
+            all_results.extend(page_results)
+            if len(page_results) < 20:
+                break
+
+    # Trim to max_results
+    all_results = all_results[:max_results]
 
     return {
         "query": query,
@@ -1048,16 +1247,78 @@ def get_listing_details(url: str) -> dict:
     -------
     dict
         Listing details including title, price, description, attributes,
-        location, images, and posting date.
+        location, images, and posting date. Details fetched within the last
+        LISTING_CACHE_TTL seconds are returned without re-fetching.
     """
+    import httpx
+
+    cached = _get_cached_listing(url)
+    if cached is not None:
+        return cached
+
     try:
         html = _fetch_page(url)
-    except httpx.HTTPStatusError as e:
-        return {"error": f"HTTP error {e.response.status_code}: {e.response.reason_phrase}", "url": url}
-    except httpx.RequestError as e:
-        return {"error": f"Request failed: {e}", "url": url}
+    except (httpx.HTTPStatusError, httpx.RequestError) as e:
+        return _fetch_error(e, url)
+
+    result = _parse_listing_detail_cached(html, url)
+    _cache_listing(url, result)
+    return result
 
-    return _parse_listing_detail(html, url)
+
+async def fetch_details(urls: list[str]) -> list[dict]:
+    """
+    Fetch and parse several Craigslist listing pages concurrently.
+
+    Requests share one connection pool and are throttled per host to
+    ``DETAIL_REQUESTS_PER_SECOND`` with a little random jitter. Listings
+    fetched within the last LISTING_CACHE_TTL seconds, by this or by
+    :func:`get_listing_details`, are served from cache.
+
+    Parameters
+    ----------
+    urls : list of str
+        Full URLs of Craigslist listing pages.
+
+    Returns
+    -------
+    list of dict
+        One entry per URL, in order — the same dict
+        :func:`get_listing_details` returns, or an error dict if that
+        listing could not be fetched.
+    """
+    import asyncio
+
+    results: dict[str, dict] = {}
+    for url in urls:
+        cached = _get_cached_listing(url)
+        if cached is not None:
+            results[url] = cached
+
+    # Only listings not fetched recently go out, each distinct URL once
+    missing = list(dict.fromkeys(url for url in urls if url not in results))
+    pages = await _fetch_many(
+        missing,
+        requests_per_second=DETAIL_REQUESTS_PER_SECOND,
+        jitter=FETCH_JITTER,
+    ) if missing else []
+    for url, page in zip(missing, pages):
+        if isinstance(page, BaseException):
+            if not isinstance(page, Exception):
+                raise page
+            results[url] = _fetch_error(page, url)
+            continue
+        # Parsing is CPU-bound, so it runs on a worker thread to keep the
+        # event loop responsive. The caches aren't thread-safe and are only
+        # touched here, on the loop thread.
+        key = _detail_cache_key(page, url)
+        result = _get_cached_detail(key)
+        if result is None:
+            result = await asyncio.to_thread(_parse_listing_detail, page, url)
+            _cache_detail(key, result)
+        results[url] = result
+        _cache_listing(url, result)
+    return [results[url] for url in urls]
 
 
 def get_locations(filter_text: str | None = None) -> dict:
@@ -1072,17 +1333,23 @@ def get_locations(filter_text: str | None = None) -> dict:
     Returns
     -------
     dict
-        A dict with total count and list of {code, name} dicts.
+        A dict with total count and list of {code, name} dicts. The dict is
+        cached and shared between calls, so treat it as read-only.
     """
-    if filter_text:
-        ft = filter_text.lower()
-        filtered = {k: v for k, v in LOCATIONS.items() if ft in k or ft in v.lower()}
+    return _locations_payload(filter_text.lower() if filter_text else "")
+
+
+@lru_cache(maxsize=256)
+def _locations_payload(ft: str) -> dict:
+    """Memoized body of :func:`get_locations` for a lowercased filter ("" for none)."""
+    if ft:
+        locations = [{"code": k, "name": v} for k, v, lower in _LOCATIONS_BY_NAME if ft in k or ft in lower]
     else:
-        filtered = LOCATIONS
+        locations = [{"code": k, "name": v} for k, v, _ in _LOCATIONS_BY_NAME]
 
     return {
-        "total": len(filtered),
-        "locations": [{"code": k, "name": v} for k, v in sorted(filtered.items(), key=lambda x: x[1])],
+        "total": len(locations),
+        "locations": locations,
     }
 
 
@@ -1093,8 +1360,15 @@ def get_categories() -> dict:
     Returns
     -------
     dict
-        A dict with total count and list of {code, name} dicts.
+        A dict with total count and list of {code, name} dicts. The dict is
+        cached and shared between calls, so treat it as read-only.
     """
+    return _categories_payload()
+
+
+@lru_cache(maxsize=None)
+def _categories_payload() -> dict:
+    """Memoized body of :func:`get_categories`; the table never changes."""
     return {
         "total": len(CATEGORIES),
         "categories": [{"code": k, "name": v} for k, v in CATEGORIES.items()],
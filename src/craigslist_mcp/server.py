@@ -5,6 +5,7 @@ and keyword.
 Tools exposed:
   • search_craigslist   — search listings with filters
   • get_listing         — get full details of a single listing
+  • get_listings        — get full details of several listings at once
   • list_locations      — list available Craigslist locations
   • list_categories     — list available search categories
 """
@@ -18,6 +19,7 @@ from fastmcp import FastMCP
 from craigslist_mcp.scraper import (
     search_listings,
     get_listing_details,
+    fetch_details,
     get_locations,
     get_categories,
     LOCATIONS,
@@ -169,6 +171,32 @@ def get_listing(url: str) -> dict:
     return get_listing_details(url=url)
 
 
+@mcp.tool()
+async def get_listings(urls: list[str]) -> dict:
+    """Get full details of several Craigslist listings at once.
+
+    Much faster than calling get_listing repeatedly — pages are fetched
+    concurrently (politely rate-limited per Craigslist city).
+
+    Parameters
+    ----------
+    urls : list[str]
+        Full URLs of Craigslist listing pages, e.g. the `url` fields from
+        search_craigslist results (max: 120; any further URLs are ignored).
+
+    Returns
+    -------
+    dict
+        A dict with:
+        - result_count: number of listings returned
+        - listings: one entry per URL, in the same order, with the same
+          fields as get_listing (or an `error` key if that listing could
+          not be fetched)
+    """
+    listings = await fetch_details(urls[:MAX_RESULTS_CAP])
+    return {"result_count": len(listings), "listings": listings}
+
+
 @mcp.tool()
 def list_locations(filter_text: str | None = None) -> dict:
     """List available Craigslist locations (cities/regions).
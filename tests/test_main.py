@@ -0,0 +1,33 @@
+"""Tests for the craigslist-mcp command line."""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+
+from craigslist_mcp import __main__ as cli
+
+
+def run_cli(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "craigslist_mcp", *args], capture_output=True, text=True, check=False
+    )
+
+
+def test_help_lists_every_flag():
+    proc = run_cli("--help")
+    assert proc.returncode == 0
+    lines = proc.stdout.splitlines()
+    assert lines[0] == f"usage: {cli._USAGE}"
+
+    options = lines[lines.index("options:") + 1:]
+    documented = {flag for line in options for flag in line.split("  ")[1].split(", ")}
+    assert documented - {"-h", "--help", "-V", "--version"} == cli._FLAGS
+    assert set(re.findall(r"\[(-[^\]]+)\]", cli._USAGE)) <= documented
+
+
+def test_unknown_flag_is_rejected():
+    proc = run_cli("--bogus")
+    assert proc.returncode == 2
+    assert proc.stderr.startswith(f"usage: {cli._USAGE}\n")
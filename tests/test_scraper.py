@@ -0,0 +1,281 @@
+"""Tests for the Craigslist scraper: page parsers, caching and fetching."""
+
+from __future__ import annotations
+
+import asyncio
+import types
+from collections import OrderedDict
+
+import httpx
+import pytest
+
+from craigslist_mcp import scraper
+
+# Gallery cards carry several classes; the BeautifulSoup parser must still
+# pick them up as result items rather than falling back to the link scan.
+GALLERY_PAGE = b"""<html><body><ol class="cl-results-page">
+<li class="cl-search-result cl-search-view-mode-gallery" data-pid="1">
+  <a href="https://newyork.craigslist.org/mnh/bik/d/road-bike/1.html" class="posting-title">
+    <span class="label">Road bike</span></a>
+  <img src="x0.jpg"><span class="priceinfo">$100</span>
+</li>
+<li class="cl-search-result cl-search-view-mode-gallery" data-pid="2">
+  <a href="https://newyork.craigslist.org/mnh/bik/d/city-bike/2.html" class="posting-title">
+    <span class="label">City bike</span></a>
+  <img src="x1.jpg"><span class="priceinfo">$200</span>
+</li>
+</ol></body></html>"""
+
+
+@pytest.fixture(params=["lxml", "lexbor"])
+def parser(request, monkeypatch):
+    """Run a test once with BeautifulSoup and once with selectolax, if installed."""
+    if request.param == "lexbor":
+        if scraper._lexbor_parser() is None:
+            pytest.skip("selectolax not installed")
+    else:
+        monkeypatch.setattr(scraper, "_lexbor_parser", lambda: None)
+    return request.param
+
+
+def test_multi_class_result_items(parser):
+    results = scraper._parse_search_results(GALLERY_PAGE, "newyork")
+    assert [(r["title"], r["price"], r["thumbnail"]) for r in results] == [
+        ("Road bike", "$100", "x0.jpg"),
+        ("City bike", "$200", "x1.jpg"),
+    ]
+
+
+def test_fallback_price_stops_at_text_boundary():
+    # Neighbouring strings must not run together: "$1,200" then "2br".
+    page = b"""<html><body><p>
+    <a href="https://newyork.craigslist.org/mnh/apa/d/sunny-flat/3.html">Sunny flat</a>
+    <span>$1,200</span><span>2br - 900ft2</span>
+    </p></body></html>"""
+    results = scraper._parse_results_fallback_html(page, "newyork")
+    assert [(r["title"], r["price"]) for r in results] == [("Sunny flat", "$1,200")]
+
+
+LISTING_URL = "https://newyork.craigslist.org/brk/bik/d/trek-road-bike/7.html"
+
+# A listing page exercising each field: the text-only title, first-match
+# price, every attribute span form, the mapAndAttrs location fallback (a
+# <small> outside it must not count), lat/long, and images repeated across
+# the thumb links, gallery, swipe and #thumbs blocks.
+LISTING_PAGE = b"""<html><head><title>Trek road bike - bikes</title></head><body>
+<h1 class="postingtitle"><span class="postingtitletext">
+  <span id="titletextonly">Trek road bike</span> <span class="price">$450</span>
+  <small>(Brooklyn)</small></span></h1>
+<time>yesterday</time>
+<div class="gallery"><img src="https://images.craigslist.org/1.jpg"></div>
+<div class="swipe"><img data-src="https://images.craigslist.org/3.jpg"></div>
+<div id="thumbs">
+  <a class="thumb" href="https://images.craigslist.org/1.jpg">1</a>
+  <a class="thumb" href="https://images.craigslist.org/2.jpg">2</a>
+  <a href="https://images.craigslist.org/4.jpg">4</a>
+</div>
+<div class="mapAndAttrs">
+  <div id="map" data-latitude="40.6782" data-longitude="-73.9442"></div>
+  <div class="mapbox"><small>Park Slope</small></div>
+  <div class="attrgroup"><span class="valu year">2019</span><span class="valu makemodel">Trek Domane</span></div>
+  <div class="attrgroup">
+    <span class="labl">Condition:</span><span class="valu">like new</span>
+    <span>frame size: <b>56cm</b></span>
+    <span>cash only</span>
+  </div>
+</div>
+<section id="postingbody"><div class="print-information">QR Code Link to This Post</div>Barely ridden.</section>
+<p class="postinginfo">posted: <time class="date timeago" datetime="2026-10-01T09:30:00-0400">Oct 1</time></p>
+<span class="price">$1</span>
+</body></html>"""
+
+LISTING_DETAIL = {
+    "url": LISTING_URL,
+    "title": "Trek road bike",
+    "price": "$450",
+    "description": "Barely ridden.",
+    "attributes": {
+        "year": "2019",
+        "make/model": "Trek Domane",
+        "condition": "like new",
+        "frame size": "56cm",
+        "cash only": "yes",
+    },
+    "location": "Park Slope",
+    "latitude": 40.6782,
+    "longitude": -73.9442,
+    "posted": "2026-10-01T09:30:00-0400",
+    "images": [
+        "https://images.craigslist.org/1.jpg",
+        "https://images.craigslist.org/3.jpg",
+        "https://images.craigslist.org/2.jpg",
+        "https://images.craigslist.org/4.jpg",
+    ],
+}
+
+# No text-only title: the heading's price/location tail is stripped. The
+# .mapaddress comes before the mapAndAttrs <small>, so it wins.
+FALLBACK_PAGE = b"""<html><head><title>Old couch</title></head><body>
+<h1 class="postingtitle"><span class="postingtitletext">Old couch -$50<small>(Queens)</small></span></h1>
+<div class="mapAndAttrs"><div class="mapaddress">31st St</div><small>Astoria</small></div>
+<time class="timeago">3 days ago</time>
+</body></html>"""
+
+FALLBACK_DETAIL = {
+    "url": LISTING_URL,
+    "title": "Old couch",
+    "price": None,
+    "description": None,
+    "attributes": None,
+    "location": "31st St",
+    "posted": "3 days ago",
+    "images": None,
+}
+
+BARE_PAGE = b"<html><head><title>Craigslist</title></head><body><p>Nothing here</p></body></html>"
+
+BARE_DETAIL = {
+    "url": LISTING_URL,
+    "title": "Craigslist",
+    "price": None,
+    "description": None,
+    "attributes": None,
+    "location": None,
+    "posted": None,
+    "images": None,
+}
+
+
+@pytest.mark.parametrize(
+    "page, expected",
+    [(LISTING_PAGE, LISTING_DETAIL), (FALLBACK_PAGE, FALLBACK_DETAIL), (BARE_PAGE, BARE_DETAIL)],
+    ids=["full", "fallbacks", "bare"],
+)
+def test_listing_detail(parser, page, expected):
+    assert scraper._parse_listing_detail(page, LISTING_URL) == expected
+
+
+@pytest.mark.parametrize("page", [LISTING_PAGE, FALLBACK_PAGE, BARE_PAGE], ids=["full", "fallbacks", "bare"])
+def test_listing_detail_parsers_agree(monkeypatch, page):
+    # The selectolax detail parser is a separate implementation; keep it
+    # returning exactly what the BeautifulSoup one does.
+    if scraper._lexbor_parser() is None:
+        pytest.skip("selectolax not installed")
+    fast = scraper._parse_listing_detail_fast(page, LISTING_URL)
+    monkeypatch.setattr(scraper, "_lexbor_parser", lambda: None)
+    assert fast == scraper._parse_listing_detail(page, LISTING_URL)
+
+
+@pytest.fixture
+def caches(monkeypatch):
+    """Start each test with empty listing caches."""
+    monkeypatch.setattr(scraper, "_listing_cache", OrderedDict())
+    monkeypatch.setattr(scraper, "_detail_cache", OrderedDict())
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A clock standing in for time.monotonic; advance it via ``clock.now``."""
+    clock = types.SimpleNamespace(now=0.0)
+    monkeypatch.setattr(scraper.time, "monotonic", lambda: clock.now)
+    return clock
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    """URLs requested through _fetch_page, which serves LISTING_PAGE."""
+    fetched: list[str] = []
+
+    def fetch_page(url):
+        fetched.append(url)
+        return LISTING_PAGE
+
+    monkeypatch.setattr(scraper, "_fetch_page", fetch_page)
+    return fetched
+
+
+def test_listing_cache_expires_after_ttl(caches, clock, fetched):
+    first = scraper.get_listing_details(LISTING_URL)
+    clock.now += scraper.LISTING_CACHE_TTL
+    assert scraper.get_listing_details(LISTING_URL) is first
+    assert fetched == [LISTING_URL]
+
+    clock.now += 1
+    scraper.get_listing_details(LISTING_URL)
+    assert fetched == [LISTING_URL, LISTING_URL]
+
+
+def test_listing_cache_skips_errors(caches, clock, monkeypatch):
+    calls = []
+
+    def failing_fetch(url):
+        calls.append(url)
+        raise httpx.ConnectError("connection refused")
+
+    monkeypatch.setattr(scraper, "_fetch_page", failing_fetch)
+    assert "error" in scraper.get_listing_details(LISTING_URL)
+    assert "error" in scraper.get_listing_details(LISTING_URL)
+    assert calls == [LISTING_URL, LISTING_URL]
+    assert not scraper._listing_cache
+
+
+def test_listing_cache_evicts_least_recently_used(caches, clock, monkeypatch):
+    monkeypatch.setattr(scraper, "_LISTING_CACHE_SIZE", 2)
+    scraper._cache_listing("a", {"url": "a"})
+    scraper._cache_listing("b", {"url": "b"})
+    assert scraper._get_cached_listing("a") == {"url": "a"}
+    scraper._cache_listing("c", {"url": "c"})
+    assert list(scraper._listing_cache) == ["a", "c"]
+    assert scraper._get_cached_listing("b") is None
+
+
+def test_fetch_details_dedupes_and_uses_cache(caches, monkeypatch):
+    # Real time here: the per-host rate limiter sleeps on the event loop.
+    monkeypatch.setattr(scraper, "DETAIL_REQUESTS_PER_SECOND", 1000.0)
+    monkeypatch.setattr(scraper, "FETCH_JITTER", 0.0)
+    fetched: list[str] = []
+
+    async def fetch_page_async(client, url):
+        fetched.append(url)
+        return LISTING_PAGE
+
+    monkeypatch.setattr(scraper, "_fetch_page_async", fetch_page_async)
+    other = LISTING_URL.replace("/7.html", "/8.html")
+    cached = {"url": "cached"}
+    scraper._cache_listing("cached", cached)
+
+    results = asyncio.run(scraper.fetch_details([LISTING_URL, "cached", other, LISTING_URL]))
+    assert sorted(fetched) == sorted([LISTING_URL, other])
+    assert results[1] is cached
+    assert results[0] is results[3]
+    assert [r["url"] for r in results] == [LISTING_URL, "cached", other, LISTING_URL]
+
+
+def test_fetch_many_stops_requesting_a_throttled_host(monkeypatch):
+    requested: list[str] = []
+
+    def handler(request):
+        requested.append(str(request.url))
+        if request.url.host == "newyork.craigslist.org":
+            return httpx.Response(429, request=request)
+        return httpx.Response(200, content=b"<html></html>", request=request)
+
+    transport = httpx.MockTransport(handler)
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: real_client(transport=transport, **kw))
+
+    throttled = [f"https://newyork.craigslist.org/mnh/bik/d/x/{i}.html" for i in range(4)]
+    other = [f"https://chicago.craigslist.org/chc/bik/d/x/{i}.html" for i in range(3)]
+    # Rate-limited per host, so the first throttled response lands before
+    # the rest of that host's URLs go out
+    pages = asyncio.run(scraper._fetch_many(throttled + other, requests_per_second=50.0))
+
+    assert requested.count(throttled[0]) == 1
+    assert not set(throttled[1:]) & set(requested)
+    assert sorted(set(requested) - set(throttled)) == sorted(other)
+    assert pages[len(throttled):] == [b"<html></html>"] * len(other)
+
+    errors = pages[:len(throttled)]
+    assert all(isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 429 for e in errors)
+    assert len({id(e) for e in errors}) == len(errors)
+    assert [str(e.request.url) for e in errors] == throttled